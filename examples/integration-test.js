@@ -3,7 +3,29 @@
  */
 
 require('dotenv').config();
-const { Client, OrderSide, TopicType } = require('./dist/index.js');
+const { formatWithOptions } = require('node:util');
+const { Client } = require('./dist/index.js');
+
+// 必需的环境变量
+const REQUIRED_ENV_VARS = Object.freeze([
+  'HOST',
+  'API_KEY',
+  'RPC_URL',
+  'PRIVATE_KEY',
+  'MULTI_SIG_ADDRESS',
+  'CHAIN_ID',
+]);
+
+// 环境变量快照（启动时读取一次）
+const ENV = Object.freeze({
+  HOST: process.env.HOST,
+  API_KEY: process.env.API_KEY,
+  RPC_URL: process.env.RPC_URL,
+  PRIVATE_KEY: process.env.PRIVATE_KEY,
+  MULTI_SIG_ADDRESS: process.env.MULTI_SIG_ADDRESS,
+  CHAIN_ID: process.env.CHAIN_ID,
+  CONDITIONAL_TOKEN_ADDR: process.env.CONDITIONAL_TOKEN_ADDR,
+});
 
 // 颜色输出
 const colors = {
@@ -15,8 +37,12 @@ const colors = {
   cyan: '\x1b[36m',
 };
 
+function formatLog(color, emoji, message) {
+  return `${colors[color]}${emoji} ${message}${colors.reset}`;
+}
+
 function log(color, emoji, message) {
-  console.log(`${colors[color]}${emoji} ${message}${colors.reset}`);
+  console.log(formatLog(color, emoji, message));
 }
 
 function logSuccess(message) {
@@ -31,29 +57,58 @@ function logInfo(message) {
   log('cyan', 'ℹ️', message);
 }
 
-function logSection(message) {
-  console.log('\n' + '='.repeat(60));
-  log('blue', '📋', message);
-  console.log('='.repeat(60));
-}
+// 缓冲一个测试区块的输出，flush() 时一次性写入 stdout（错误详情写入 stderr）
+class SectionOutput {
+  constructor() {
+    this.lines = [];
+    this.details = [];
+  }
 
-// 验证配置
-function validateConfig() {
-  const required = {
-    'HOST': process.env.HOST,
-    'API_KEY': process.env.API_KEY,
-    'RPC_URL': process.env.RPC_URL,
-    'PRIVATE_KEY': process.env.PRIVATE_KEY,
-    'MULTI_SIG_ADDRESS': process.env.MULTI_SIG_ADDRESS,
-    'CHAIN_ID': process.env.CHAIN_ID,
-  };
+  line(text = '') {
+    this.lines.push(text);
+  }
+
+  log(color, emoji, message) {
+    this.lines.push(formatLog(color, emoji, message));
+  }
+
+  success(message) {
+    this.log('green', '✅', message);
+  }
+
+  error(message) {
+    this.log('red', '❌', message);
+  }
+
+  info(message) {
+    this.log('cyan', 'ℹ️', message);
+  }
 
-  const missing = [];
-  for (const [key, value] of Object.entries(required)) {
-    if (!value) {
-      missing.push(key);
+  detail(error) {
+    this.details.push(formatWithOptions({ colors: process.stderr.isTTY }, error));
+  }
+
+  section(message) {
+    this.lines.push('\n' + '='.repeat(60));
+    this.log('blue', '📋', message);
+    this.lines.push('='.repeat(60));
+  }
+
+  flush() {
+    if (this.lines.length > 0) {
+      process.stdout.write(this.lines.join('\n') + '\n');
+      this.lines = [];
+    }
+    if (this.details.length > 0) {
+      process.stderr.write(this.details.join('\n') + '\n');
+      this.details = [];
     }
   }
+}
+
+// 验证配置
+function validateConfig() {
+  const missing = REQUIRED_ENV_VARS.filter((key) => !ENV[key]);
 
   if (missing.length > 0) {
     logError(`缺少必需的环境变量: ${missing.join(', ')}`);
@@ -62,7 +117,7 @@ function validateConfig() {
   }
 
   // 验证私钥格式
-  const privateKey = process.env.PRIVATE_KEY;
+  const privateKey = ENV.PRIVATE_KEY;
   let useTestKey = false;
   if (!privateKey.startsWith('0x')) {
     logError('PRIVATE_KEY 必须以 0x 开头');
@@ -76,7 +131,7 @@ function validateConfig() {
   }
 
   // 验证地址格式
-  const address = process.env.MULTI_SIG_ADDRESS;
+  const address = ENV.MULTI_SIG_ADDRESS;
   if (!address.startsWith('0x') || address.length !== 42) {
     logError('MULTI_SIG_ADDRESS 格式不正确');
     process.exit(1);
@@ -97,16 +152,16 @@ function initClient(useTestKey = false) {
     // 如果私钥不完整，使用临时测试私钥（仅用于初始化客户端）
     const privateKey = useTestKey
       ? '0x1234567890123456789012345678901234567890123456789012345678901234'
-      : process.env.PRIVATE_KEY;
+      : ENV.PRIVATE_KEY;
 
     const client = new Client({
-      host: process.env.HOST,
-      apiKey: process.env.API_KEY,
-      rpcUrl: process.env.RPC_URL,
+      host: ENV.HOST,
+      apiKey: ENV.API_KEY,
+      rpcUrl: ENV.RPC_URL,
       privateKey: privateKey,
-      vaultAddress: process.env.MULTI_SIG_ADDRESS,
-      chainId: parseInt(process.env.CHAIN_ID),
-      conditionalTokensAddr: process.env.CONDITIONAL_TOKEN_ADDR,
+      vaultAddress: ENV.MULTI_SIG_ADDRESS,
+      chainId: parseInt(ENV.CHAIN_ID),
+      conditionalTokensAddr: ENV.CONDITIONAL_TOKEN_ADDR,
     });
 
     if (useTestKey) {
@@ -124,277 +179,303 @@ function initClient(useTestKey = false) {
 
 // 测试函数
 async function testGetQuoteTokens(client) {
-  logSection('测试 1: 获取支持的报价代币 (getQuoteTokens)');
+  const out = new SectionOutput();
+  out.section('测试 1: 获取支持的报价代币 (getQuoteTokens)');
   try {
     const tokens = await client.getQuoteTokens();
-    logSuccess(`成功获取 ${tokens.length} 个报价代币`);
+    out.success(`成功获取 ${tokens.length} 个报价代币`);
     tokens.forEach((token, i) => {
-      console.log(`  ${i + 1}. ${token.symbol} (${token.quoteTokenName})`);
-      console.log(`     地址: ${token.quoteTokenAddress}`);
-      console.log(`     精度: ${token.decimal}`);
+      out.line(`  ${i + 1}. ${token.symbol} (${token.quoteTokenName})`);
+      out.line(`     地址: ${token.quoteTokenAddress}`);
+      out.line(`     精度: ${token.decimal}`);
       if (token.ctfExchangeAddress) {
-        console.log(`     交易所: ${token.ctfExchangeAddress}`);
+        out.line(`     交易所: ${token.ctfExchangeAddress}`);
       }
     });
+    out.flush();
     return tokens;
   } catch (error) {
-    logError(`失败: ${error.message}`);
-    console.error(error);
+    out.error(`失败: ${error.message}`);
+    out.detail(error);
+    out.flush();
     return null;
   }
 }
 
 async function testGetMarkets(client) {
-  logSection('测试 2: 获取市场列表 (getMarkets)');
+  const out = new SectionOutput();
+  out.section('测试 2: 获取市场列表 (getMarkets)');
   try {
     const result = await client.getMarkets({ page: 1, limit: 5 });
-    logSuccess(`成功获取 ${result.list.length} 个市场`);
+    out.success(`成功获取 ${result.list.length} 个市场`);
     if (result.total) {
-      logInfo(`总共有 ${result.total} 个市场`);
+      out.info(`总共有 ${result.total} 个市场`);
     }
     result.list.forEach((market, i) => {
-      console.log(`\n  ${i + 1}. [ID: ${market.marketId}] ${market.marketTitle}`);
-      console.log(`     状态: ${market.status} (${market.statusEnum || 'N/A'})`);
+      out.line(`\n  ${i + 1}. [ID: ${market.marketId}] ${market.marketTitle}`);
+      out.line(`     状态: ${market.status} (${market.statusEnum || 'N/A'})`);
       if (market.quoteToken) {
-        console.log(`     报价代币: ${market.quoteToken}`);
+        out.line(`     报价代币: ${market.quoteToken}`);
       }
       if (market.yesTokenId && market.noTokenId) {
-        console.log(`     Yes: ${market.yesLabel || 'YES'}, No: ${market.noLabel || 'NO'}`);
+        out.line(`     Yes: ${market.yesLabel || 'YES'}, No: ${market.noLabel || 'NO'}`);
       }
       if (market.volume) {
-        console.log(`     交易量: ${market.volume}`);
+        out.line(`     交易量: ${market.volume}`);
       }
     });
+    out.flush();
     return result.list;
   } catch (error) {
-    logError(`失败: ${error.message}`);
-    console.error(error);
+    out.error(`失败: ${error.message}`);
+    out.detail(error);
+    out.flush();
     return [];
   }
 }
 
 async function testGetMarket(client, marketId) {
-  logSection(`测试 3: 获取单个市场详情 (getMarket) - Market ID: ${marketId}`);
+  const out = new SectionOutput();
+  out.section(`测试 3: 获取单个市场详情 (getMarket) - Market ID: ${marketId}`);
   try {
     const market = await client.getMarket(marketId);
-    console.log('市场详情',market);
-    logSuccess(`成功获取市场详情`);
-    console.log(`  标题: ${market.marketTitle}`);
-    console.log(`  ID: ${market.marketId}`);
-    console.log(`  状态: ${market.status} (${market.statusEnum || 'N/A'})`);
-    console.log(`  报价代币: ${market.quoteToken}`);
+    out.line(formatWithOptions({ colors: process.stdout.isTTY }, '市场详情', market));
+    out.success(`成功获取市场详情`);
+    out.line(`  标题: ${market.marketTitle}`);
+    out.line(`  ID: ${market.marketId}`);
+    out.line(`  状态: ${market.status} (${market.statusEnum || 'N/A'})`);
+    out.line(`  报价代币: ${market.quoteToken}`);
     if (market.conditionId) {
-      console.log(`  条件 ID: ${market.conditionId}`);
+      out.line(`  条件 ID: ${market.conditionId}`);
     }
     if (market.yesTokenId && market.noTokenId) {
-      console.log(`  结果代币:`);
-      console.log(`    Yes (${market.yesLabel || 'YES'}): ${market.yesTokenId.substring(0, 20)}...`);
-      console.log(`    No (${market.noLabel || 'NO'}): ${market.noTokenId.substring(0, 20)}...`);
+      out.line(`  结果代币:`);
+      out.line(`    Yes (${market.yesLabel || 'YES'}): ${market.yesTokenId.substring(0, 20)}...`);
+      out.line(`    No (${market.noLabel || 'NO'}): ${market.noTokenId.substring(0, 20)}...`);
     }
+    out.flush();
     return market;
   } catch (error) {
-    logError(`失败: ${error.message}`);
-    console.error(error);
+    out.error(`失败: ${error.message}`);
+    out.detail(error);
+    out.flush();
     return null;
   }
 }
 
 async function testGetOrderbook(client, tokenId) {
-  logSection(`测试 4: 获取订单簿 (getOrderbook)`);
+  const out = new SectionOutput();
+  out.section(`测试 4: 获取订单簿 (getOrderbook)`);
   try {
     const orderbook = await client.getOrderbook(tokenId);
-    logSuccess(`成功获取订单簿`);
-    console.log(`  买单 (Bids): ${orderbook.bids ? orderbook.bids.length : 0} 个价格档位`);
-    if (orderbook.bids && orderbook.bids.length > 0) {
-      console.log(`    最高买价: ${orderbook.bids[0].price} (数量: ${orderbook.bids[0].size})`);
+    out.success(`成功获取订单簿`);
+    const bids = orderbook.bids || [];
+    const asks = orderbook.asks || [];
+    out.line(`  买单 (Bids): ${bids.length} 个价格档位`);
+    if (bids.length > 0) {
+      const bestBid = bids[0];
+      out.line(`    最高买价: ${bestBid.price} (数量: ${bestBid.size})`);
     }
-    console.log(`  卖单 (Asks): ${orderbook.asks ? orderbook.asks.length : 0} 个价格档位`);
-    if (orderbook.asks && orderbook.asks.length > 0) {
-      console.log(`    最低卖价: ${orderbook.asks[0].price} (数量: ${orderbook.asks[0].size})`);
+    out.line(`  卖单 (Asks): ${asks.length} 个价格档位`);
+    if (asks.length > 0) {
+      const bestAsk = asks[0];
+      out.line(`    最低卖价: ${bestAsk.price} (数量: ${bestAsk.size})`);
     }
+    out.flush();
     return orderbook;
   } catch (error) {
-    logError(`失败: ${error.message}`);
-    console.error(error);
+    out.error(`失败: ${error.message}`);
+    out.detail(error);
+    out.flush();
     return null;
   }
 }
 
 async function testGetPriceHistory(client, tokenId) {
-  logSection(`测试 5: 获取价格历史 (getPriceHistory)`);
+  const out = new SectionOutput();
+  out.section(`测试 5: 获取价格历史 (getPriceHistory)`);
   try {
     const history = await client.getPriceHistory({
       tokenId: tokenId,
       interval: '1h',
     });
-    logSuccess(`成功获取价格历史`);
-    console.log(`  数据点数量: ${history.length}`);
+    out.success(`成功获取价格历史`);
+    out.line(`  数据点数量: ${history.length}`);
     if (history.length > 0) {
       const latest = history[history.length - 1];
-      console.log(`  最新价格: ${latest.p}`);
+      out.line(`  最新价格: ${latest.p}`);
       if (latest.t) {
-        console.log(`  时间戳: ${new Date(latest.t * 1000).toLocaleString()}`);
+        out.line(`  时间戳: ${new Date(latest.t * 1000).toLocaleString()}`);
       }
       if (latest.v) {
-        console.log(`  成交量: ${latest.v}`);
+        out.line(`  成交量: ${latest.v}`);
       }
     }
+    out.flush();
     return history;
   } catch (error) {
-    logError(`失败: ${error.message}`);
-    console.error(error);
+    out.error(`失败: ${error.message}`);
+    out.detail(error);
+    out.flush();
     return null;
   }
 }
 
 async function testGetLatestPrice(client, tokenId) {
-  logSection(`测试 6: 获取最新价格 (getLatestPrice)`);
+  const out = new SectionOutput();
+  out.section(`测试 6: 获取最新价格 (getLatestPrice)`);
   try {
     const result = await client.getLatestPrice(tokenId);
-    logSuccess(`成功获取最新价格`);
-    console.log(`  价格: ${result.price}`);
+    out.success(`成功获取最新价格`);
+    out.line(`  价格: ${result.price}`);
+    out.flush();
     return result;
   } catch (error) {
-    logError(`失败: ${error.message}`);
-    console.error(error);
+    out.error(`失败: ${error.message}`);
+    out.detail(error);
+    out.flush();
     return null;
   }
 }
 
 async function testGetFeeRates(client, tokenId) {
-  logSection(`测试 7: 获取手续费率 (getFeeRates)`);
+  const out = new SectionOutput();
+  out.section(`测试 7: 获取手续费率 (getFeeRates)`);
   try {
     const fees = await client.getFeeRates(tokenId);
-    logSuccess(`成功获取手续费率`);
-    console.log(`  Maker 费率: ${fees.makerFeeBps} bps`);
-    console.log(`  Taker 费率: ${fees.takerFeeBps} bps`);
+    out.success(`成功获取手续费率`);
+    out.line(`  Maker 费率: ${fees.makerFeeBps} bps`);
+    out.line(`  Taker 费率: ${fees.takerFeeBps} bps`);
+    out.flush();
     return fees;
   } catch (error) {
-    logError(`失败: ${error.message}`);
-    console.error(error);
+    out.error(`失败: ${error.message}`);
+    out.detail(error);
+    out.flush();
     return null;
   }
 }
 
-async function testGetMyOrders(client) {
-  logSection('测试 8: 获取我的订单 (getMyOrders)');
+async function testGetMyOrders(client, out) {
+  out.section('测试 8: 获取我的订单 (getMyOrders)');
   try {
     const result = await client.getMyOrders({ page: 1, limit: 10 });
-    logSuccess(`成功获取订单列表`);
-    console.log(`  订单数量: ${result.list.length}`);
+    out.success(`成功获取订单列表`);
+    out.line(`  订单数量: ${result.list.length}`);
     if (result.total) {
-      logInfo(`总订单数: ${result.total}`);
+      out.info(`总订单数: ${result.total}`);
     }
     result.list.forEach((order, i) => {
-      console.log(`\n  ${i + 1}. 订单 ID: ${order.orderId}`);
-      console.log(`     市场 ID: ${order.marketId}`);
-      console.log(`     方向: ${order.sideEnum}`);
-      console.log(`     价格: ${order.price}`);
-      console.log(`     状态: ${order.statusEnum}`);
+      out.line(`\n  ${i + 1}. 订单 ID: ${order.orderId}`);
+      out.line(`     市场 ID: ${order.marketId}`);
+      out.line(`     方向: ${order.sideEnum}`);
+      out.line(`     价格: ${order.price}`);
+      out.line(`     状态: ${order.statusEnum}`);
     });
     return result;
   } catch (error) {
-    logError(`失败: ${error.message}`);
-    console.error(error);
+    out.error(`失败: ${error.message}`);
+    out.detail(error);
     return { list: [] };
   }
 }
 
-async function testGetMyPositions(client) {
-  logSection('测试 9: 获取我的持仓 (getMyPositions)');
+async function testGetMyPositions(client, out) {
+  out.section('测试 9: 获取我的持仓 (getMyPositions)');
   try {
     const result = await client.getMyPositions({ page: 1, limit: 10 });
-    logSuccess(`成功获取持仓列表`);
-    console.log(`  持仓数量: ${result.list.length}`);
+    out.success(`成功获取持仓列表`);
+    out.line(`  持仓数量: ${result.list.length}`);
     if (result.total) {
-      logInfo(`总持仓数: ${result.total}`);
+      out.info(`总持仓数: ${result.total}`);
     }
     result.list.forEach((pos, i) => {
-      console.log(`\n  ${i + 1}. 市场 ID: ${pos.marketId}`);
-      console.log(`     结果: ${pos.outcome}`);
-      console.log(`     持仓量: ${pos.sharesOwned}`);
+      out.line(`\n  ${i + 1}. 市场 ID: ${pos.marketId}`);
+      out.line(`     结果: ${pos.outcome}`);
+      out.line(`     持仓量: ${pos.sharesOwned}`);
       if (pos.avgEntryPrice) {
-        console.log(`     平均价格: ${pos.avgEntryPrice}`);
+        out.line(`     平均价格: ${pos.avgEntryPrice}`);
       }
       if (pos.unrealizedPnl) {
-        console.log(`     未实现盈亏: ${pos.unrealizedPnl}`);
+        out.line(`     未实现盈亏: ${pos.unrealizedPnl}`);
       }
     });
     return result;
   } catch (error) {
-    logError(`失败: ${error.message}`);
-    console.error(error);
+    out.error(`失败: ${error.message}`);
+    out.detail(error);
     return { list: [] };
   }
 }
 
-async function testGetMyBalances(client) {
-  logSection('测试 10: 获取我的余额 (getMyBalances)');
+async function testGetMyBalances(client, out) {
+  out.section('测试 10: 获取我的余额 (getMyBalances)');
   try {
     const result = await client.getMyBalances();
-    logSuccess(`成功获取余额列表`);
-    console.log(`  钱包地址: ${result.walletAddress}`);
-    console.log(`  多签地址: ${result.multiSignAddress || 'N/A'}`);
-    console.log(`  链 ID: ${result.chainId}`);
-    console.log(`  代币数量: ${result.balances?.length || 0}`);
-
-    if (result.balances && result.balances.length > 0) {
-      result.balances.forEach((balance, i) => {
-        console.log(`\n  ${i + 1}. 代币: ${balance.quoteToken}`);
-        console.log(`     总余额: ${balance.totalBalance}`);
-        console.log(`     可用余额: ${balance.availableBalance}`);
-        console.log(`     冻结余额: ${balance.frozenBalance}`);
-        console.log(`     精度: ${balance.tokenDecimals}`);
+    out.success(`成功获取余额列表`);
+    out.line(`  钱包地址: ${result.walletAddress}`);
+    out.line(`  多签地址: ${result.multiSignAddress || 'N/A'}`);
+    out.line(`  链 ID: ${result.chainId}`);
+    const balances = result.balances || [];
+    out.line(`  代币数量: ${balances.length}`);
+
+    if (balances.length > 0) {
+      balances.forEach((balance, i) => {
+        out.line(`\n  ${i + 1}. 代币: ${balance.quoteToken}`);
+        out.line(`     总余额: ${balance.totalBalance}`);
+        out.line(`     可用余额: ${balance.availableBalance}`);
+        out.line(`     冻结余额: ${balance.frozenBalance}`);
+        out.line(`     精度: ${balance.tokenDecimals}`);
       });
     }
     return result;
   } catch (error) {
-    logError(`失败: ${error.message}`);
-    console.error(error);
+    out.error(`失败: ${error.message}`);
+    out.detail(error);
     return null;
   }
 }
 
-async function testGetMyTrades(client) {
-  logSection('测试 11: 获取我的交易历史 (getMyTrades)');
+async function testGetMyTrades(client, out) {
+  out.section('测试 11: 获取我的交易历史 (getMyTrades)');
   try {
     const result = await client.getMyTrades({ page: 1, limit: 10 });
-    logSuccess(`成功获取交易历史`);
-    console.log(`  交易数量: ${result.list.length}`);
+    out.success(`成功获取交易历史`);
+    out.line(`  交易数量: ${result.list.length}`);
     if (result.total) {
-      logInfo(`总交易数: ${result.total}`);
+      out.info(`总交易数: ${result.total}`);
     }
     result.list.forEach((trade, i) => {
-      console.log(`\n  ${i + 1}. 交易 ID: ${trade.tradeNo}`);
-      console.log(`     市场 ID: ${trade.marketId}`);
-      console.log(`     方向: ${trade.side}`);
-      console.log(`     价格: ${trade.price}`);
-      console.log(`     数量: ${trade.amount}`);
+      out.line(`\n  ${i + 1}. 交易 ID: ${trade.tradeNo}`);
+      out.line(`     市场 ID: ${trade.marketId}`);
+      out.line(`     方向: ${trade.side}`);
+      out.line(`     价格: ${trade.price}`);
+      out.line(`     数量: ${trade.amount}`);
       if (trade.fee) {
-        console.log(`     手续费: ${trade.fee}`);
+        out.line(`     手续费: ${trade.fee}`);
       }
       if (trade.createdAt) {
-        console.log(`     时间: ${new Date(trade.createdAt * 1000).toLocaleString()}`);
+        out.line(`     时间: ${new Date(trade.createdAt * 1000).toLocaleString()}`);
       }
     });
     return result;
   } catch (error) {
-    logError(`失败: ${error.message}`);
-    console.error(error);
+    out.error(`失败: ${error.message}`);
+    out.detail(error);
     return { list: [] };
   }
 }
 
-async function testGetUserAuth(client) {
-  logSection('测试 12: 获取用户认证信息 (getUserAuth)');
+async function testGetUserAuth(client, out) {
+  out.section('测试 12: 获取用户认证信息 (getUserAuth)');
   try {
     const auth = await client.getUserAuth();
-    logSuccess(`成功获取用户认证信息`);
-    console.log(`  认证信息:`, JSON.stringify(auth, null, 2));
+    out.success(`成功获取用户认证信息`);
+    out.line(`  认证信息: ${JSON.stringify(auth, null, 2)}`);
     return auth;
   } catch (error) {
-    logError(`失败: ${error.message}`);
-    console.error(error);
+    out.error(`失败: ${error.message}`);
+    out.detail(error);
     return null;
   }
 }
@@ -491,57 +572,39 @@ async function runAllTests() {
     failCount += 5;
   }
 
-  // 测试 8: 获取我的订单
-  const orders = await testGetMyOrders(client);
-  if (orders) {
-    successCount++;
-  } else {
-    failCount++;
-  }
-
-  // 测试 9: 获取我的持仓
-  const positions = await testGetMyPositions(client);
-  if (positions) {
-    successCount++;
-  } else {
-    failCount++;
-  }
-
-  // 测试 10: 获取我的余额
-  const balances = await testGetMyBalances(client);
-  if (balances) {
-    successCount++;
-  } else {
-    failCount++;
+  // 测试 8-12 互不依赖，并发执行；输出先缓冲，再按 8 -> 12 的固定顺序写出
+  const accountOutputs = Array.from({ length: 5 }, () => new SectionOutput());
+  const accountResults = await Promise.all([
+    testGetMyOrders(client, accountOutputs[0]),
+    testGetMyPositions(client, accountOutputs[1]),
+    testGetMyBalances(client, accountOutputs[2]),
+    testGetMyTrades(client, accountOutputs[3]),
+    testGetUserAuth(client, accountOutputs[4]),
+  ]);
+  for (const out of accountOutputs) {
+    out.flush();
   }
-
-  // 测试 11: 获取我的交易历史
-  const trades = await testGetMyTrades(client);
-  if (trades) {
-    successCount++;
-  } else {
-    failCount++;
-  }
-
-  // 测试 12: 获取用户认证信息
-  const auth = await testGetUserAuth(client);
-  if (auth) {
-    successCount++;
-  } else {
-    failCount++;
+  for (const result of accountResults) {
+    if (result) {
+      successCount++;
+    } else {
+      failCount++;
+    }
   }
 
   // 打印测试总结
-  console.log('\n');
-  console.log('='.repeat(60));
-  log('blue', '📊', '测试总结');
-  console.log('='.repeat(60));
-  logSuccess(`成功: ${successCount} 个测试`);
+  const out = new SectionOutput();
+  out.line('\n');
+  out.line('='.repeat(60));
+  out.log('blue', '📊', '测试总结');
+  out.line('='.repeat(60));
+  out.success(`成功: ${successCount} 个测试`);
   if (failCount > 0) {
-    logError(`失败: ${failCount} 个测试`);
+    out.error(`失败: ${failCount} 个测试`);
   }
-  console.log(`总计: ${successCount + failCount} 个测试`);
-  console.log('');
+  out.line(`总计: ${successCount + failCount} 个测试`);
+  out.line('');
+  out.flush();
 
   // 返回结果供进一步使用
   return {
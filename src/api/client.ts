@@ -1,11 +1,26 @@
 import { OpenApiError } from '../errors.js';
 import { ProxyAgent } from 'undici';
 
+/**
+ * Matches an underscore followed by a lowercase letter (hoisted so it is built once)
+ */
+const SNAKE_SEGMENT_RE = /_([a-z])/g;
+
+/**
+ * Converted key names; request bodies only use a small, fixed set of field names
+ */
+const camelCaseKeyCache: Map<string, string> = new Map();
+
 /**
  * Convert object keys to camelCase recursively
  */
 function toCamelCase(str: string): string {
-  return str.replace(/_([a-z])/g, (_, letter) => letter.toUpperCase());
+  let camelKey = camelCaseKeyCache.get(str);
+  if (camelKey === undefined) {
+    camelKey = str.replace(SNAKE_SEGMENT_RE, (_, letter) => letter.toUpperCase());
+    camelCaseKeyCache.set(str, camelKey);
+  }
+  return camelKey;
 }
 
 function convertKeysToCamelCase(obj: any): any {
@@ -1,20 +1,14 @@
 import os
-os.environ['HTTP_PROXY']="http://172.28.80.1:7890"
-os.environ['HTTPS_PROXY']="http://172.28.80.1:7890"
-os.environ['http_proxy']="http://172.28.80.1:7890"
-os.environ['https_proxy']="http://172.28.80.1:7890"
+os.environ.update({
+    'HTTP_PROXY': "http://172.28.80.1:7890",
+    'HTTPS_PROXY': "http://172.28.80.1:7890",
+    'http_proxy': "http://172.28.80.1:7890",
+    'https_proxy': "http://172.28.80.1:7890",
+})
 from dotenv import load_dotenv
 from opinion_clob_sdk import Client
-os.environ['HTTP_PROXY']="http://172.28.80.1:7890"
-os.environ['HTTPS_PROXY']="http://172.28.80.1:7890"
-os.environ['http_proxy']="http://172.28.80.1:7890"
-os.environ['https_proxy']="http://172.28.80.1:7890"
 # Load environment variables
 load_dotenv()
-os.environ['HTTP_PROXY']="http://172.28.80.1:7890"
-os.environ['HTTPS_PROXY']="http://172.28.80.1:7890"
-os.environ['http_proxy']="http://172.28.80.1:7890"
-os.environ['https_proxy']="http://172.28.80.1:7890"
 # Initialize client
 print(os.getenv('PRIVATE_KEY'))
 client = Client(